@@ -1,77 +1,121 @@
 import random
+import time
 from player import Player
-from gemini_client import request_move
+from gemini_client import request_move, is_available as gemini_available
+from game_logic import COMPLETING, SAFE, SACRIFICING
+
+# Below this many seconds of soft budget a Gemini round-trip is not attempted
+MIN_REMOTE_TIME = 1.0
+
+def _past(deadline):
+    """Whether an optional time.monotonic() deadline has passed."""
+    return deadline is not None and time.monotonic() >= deadline
 
 class AIPlayer(Player):
     """AI Player that uses Gemini SDK or heuristic fallback."""
 
+    def __init__(self, name, time_manager=None, opening_book=None, evaluator=None):
+        """
+        Initialize the AI player.
+        :param name: The name of the player.
+        :param time_manager: Optional TimeManager used when the game has a clock.
+        :param opening_book: Optional OpeningBook consulted before anything else.
+        :param evaluator: Optional TiledEvaluator used by the heuristic on large boards.
+        """
+        super().__init__(name)
+        self.time_manager = time_manager
+        self.opening_book = opening_book
+        self.evaluator = evaluator
+
     def choose_move(self, game_logic):
-        valid_moves = game_logic.get_valid_moves()
-        if not valid_moves:
+        # Start of the move: every scan below, including time allocation, is charged to it
+        started = time.monotonic()
+        if game_logic.count_valid_moves() == 0:
             return None
+        deadline = None
+        timeout = None
+        if self.time_manager is not None:
+            budget = self.time_manager.allocate(game_logic, started=started)
+            if budget is not None:
+                soft, hard = budget
+                deadline = started + hard
+                timeout = soft
+        if self.opening_book is not None and not _past(deadline):
+            move = self.opening_book.lookup(game_logic)
+            if move and game_logic.grid.is_valid_line(*move):
+                return move
+        scan = None
+        if self.evaluator is None:
+            # One pass classifies the board; an immediate capture ends it and needs nothing else
+            scan = self._scan_moves(game_logic, deadline)
+            if scan[0] is not None:
+                return scan[0]
+        if _past(deadline):
+            return game_logic.first_valid_move()
+        if timeout is not None and timeout < MIN_REMOTE_TIME:
+            return self._heuristic_move(game_logic, deadline, scan)
+        if not gemini_available():
+            return self._heuristic_move(game_logic, deadline, scan)
         # Attempt Gemini move
+        valid_moves = scan[1] + scan[2] if scan is not None else game_logic.get_valid_moves()
         player_scores = {p.name: p.score for p in game_logic.players}
         lines_drawn = list(game_logic.grid.lines)
         completed_squares = list(game_logic.completed_squares)
+        grid = game_logic.grid
+        if deadline is not None:
+            # The request must end by the hard deadline, which is counted from the start of the move
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout < MIN_REMOTE_TIME:
+                return self._heuristic_move(game_logic, deadline, scan)
         move = request_move(
-            board_size=game_logic.grid.size,
+            board_size=grid.size if grid.width == grid.height else f"{grid.width}x{grid.height}",
             lines_drawn=lines_drawn,
             completed_squares=completed_squares,
             player_scores=player_scores,
             current_player=self.name,
             valid_moves=valid_moves,
+            timeout=timeout,
         )
         if move and move in valid_moves:
             return move
         # Fallback heuristic
-        return self._heuristic_move(game_logic, valid_moves)
+        return self._heuristic_move(game_logic, deadline, scan)
+
+    def _scan_moves(self, game_logic, deadline=None):
+        # Single classification pass: (completing move or None, safe moves, other moves)
+        # Stops at the first completing move or at the deadline
+        safe, others = [], []
+        for move in game_logic.iter_valid_moves(deadline=deadline):
+            category = game_logic.classify_move(*move)
+            if category == COMPLETING:
+                return move, safe, others
+            if category == SAFE:
+                safe.append(move)
+            else:
+                others.append(move)
+        return None, safe, others
 
-    def _heuristic_move(self, game_logic, valid_moves):
-        # 1. Moves that complete a square
-        completing = []
-        for (a, b) in valid_moves:
-            if game_logic.will_complete_square(a, b) > 0:
-                completing.append((a, b))
-        if completing:
-            return random.choice(completing)
+    def _heuristic_move(self, game_logic, deadline=None, scan=None):
+        if self.evaluator is not None:
+            return self._tiled_heuristic_move(game_logic, deadline)
+        # Reuse the caller's scan if there is one; the scan ends at the deadline
+        completing, safe, others = scan if scan is not None else self._scan_moves(game_logic, deadline)
+        # 1. A move that completes a square
+        if completing is not None:
+            return completing
         # 2. Avoid creating third side (i.e., moves that create a nearly complete square for opponent)
-        safe = []
-        for (a, b) in valid_moves:
-            if not self._creates_third_side(game_logic, a, b):
-                safe.append((a, b))
         if safe:
             return random.choice(safe)
-        # 3. Any move
-        return random.choice(valid_moves)
+        # 3. Any move; with nothing scanned before the deadline, the cheapest valid one
+        if others:
+            return random.choice(others)
+        return game_logic.first_valid_move()
 
-    def _creates_third_side(self, game_logic, a, b):
-        # Check potential squares around the line; if adding it creates a square with exactly 3 sides (so opponent can finish), mark risky
-        x1, y1 = a
-        x2, y2 = b
-        size = game_logic.grid.size
-        potential = []
-        if x1 == x2:  # vertical
-            potential.append((min(x1, x2) - 1, min(y1, y2)))
-            potential.append((min(x1, x2), min(y1, y2)))
-        elif y1 == y2:  # horizontal
-            potential.append((min(x1, x2), min(y1, y2) - 1))
-            potential.append((min(x1, x2), min(y1, y2)))
-        lines = set(game_logic.grid.lines)
-        # consider candidate line
-        lines.add((a, b))
-        for sx, sy in potential:
-            if sx < 0 or sy < 0 or sx >= size - 1 or sy >= size - 1:
-                continue
-            edges = [
-                ((sx, sy), (sx + 1, sy)),
-                ((sx, sy + 1), (sx + 1, sy + 1)),
-                ((sx, sy), (sx, sy + 1)),
-                ((sx + 1, sy), (sx + 1, sy + 1)),
-            ]
-            present = 0
-            for e in edges:
-                if e in lines or (e[1], e[0]) in lines:
-                    present += 1
-            if present == 3 and ((a, b) in edges or (b, a) in edges):
-                return True
-        return False
+    def _tiled_heuristic_move(self, game_logic, deadline=None):
+        # Same preference order as _heuristic_move, with all moves classified in one parallel pass
+        # The evaluator stops at the deadline and returns only the tiles it finished
+        classes = self.evaluator.classify(game_logic, deadline)
+        for category in (COMPLETING, SAFE, SACRIFICING):
+            if classes[category]:
+                return random.choice(classes[category])
+        return game_logic.first_valid_move()
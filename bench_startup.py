@@ -0,0 +1,78 @@
+"""
+Startup-time benchmark.
+
+Times fresh interpreter processes importing the game entry point and the
+headless paths (AI player, tournament workers, tiled evaluator workers), and
+reports whether the Gemini SDK was imported along the way.
+
+Usage:
+    python bench_startup.py [--repeat 10] [--importtime]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+TARGETS = ["main", "ai_player", "tournament", "opening_book", "parallel_eval"]
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SDK_MODULE = "google.generativeai"
+
+
+def time_import(module, repeat):
+    """
+    Import a module in fresh interpreters.
+    :param module: Module name to import.
+    :param repeat: Number of processes to start.
+    :return: Tuple (list of wall-clock seconds, whether the SDK was loaded).
+    """
+    code = f"import sys, {module}; print({SDK_MODULE!r} in sys.modules)"
+    timings = []
+    sdk_loaded = False
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = subprocess.run([sys.executable, "-c", code], cwd=HERE, check=True,
+                                capture_output=True, text=True).stdout
+        timings.append(time.perf_counter() - started)
+        sdk_loaded = sdk_loaded or output.strip() == "True"
+    return timings, sdk_loaded
+
+
+def slowest_imports(module, top=10):
+    """
+    Get the slowest cumulative imports reported by -X importtime.
+    :return: List of (microseconds, module name).
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=HERE, check=True, capture_output=True, text=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure interpreter startup plus import time.")
+    parser.add_argument("--repeat", type=int, default=10, help="processes per target")
+    parser.add_argument("--importtime", action="store_true", help="also list the slowest imports")
+    args = parser.parse_args()
+
+    baseline, _ = time_import("sys", args.repeat)
+    base = statistics.median(baseline)
+    print(f"{'target':<15}{'median ms':>10}{'over bare':>11}  sdk loaded")
+    print(f"{'(bare python)':<15}{base * 1000:>10.1f}{'':>11}")
+    for module in TARGETS:
+        timings, sdk_loaded = time_import(module, args.repeat)
+        median = statistics.median(timings)
+        print(f"{module:<15}{median * 1000:>10.1f}{(median - base) * 1000:>11.1f}  {sdk_loaded}")
+        if args.importtime:
+            for micros, name in slowest_imports(module):
+                print(f"    {micros / 1000:>8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
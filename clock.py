@@ -0,0 +1,158 @@
+"""
+Game clock and time management for AI players.
+
+GameClock keeps per-player time budgets with an optional increment per move.
+TimeManager splits a player's remaining time across the moves still to play,
+spending more in the chain-forming middlegame than in forced openings and
+endgames, and always returns a hard limit that fits inside the budget.
+"""
+import time
+
+OPENING = "opening"
+MIDDLEGAME = "middlegame"
+ENDGAME = "endgame"
+
+# Largest share of a move's hard limit that TimeManager may spend classifying the phase
+PHASE_SCAN_SHARE = 0.25
+
+
+class GameClock:
+    def __init__(self, num_players, initial_time, increment=0.0, time_source=time.monotonic):
+        """
+        Initialize the clock.
+        :param num_players: Number of seats.
+        :param initial_time: Starting budget in seconds, or a list with one budget per seat.
+        :param increment: Seconds added to a player's budget after each completed move.
+        :param time_source: Callable returning the current time in seconds.
+        """
+        if isinstance(initial_time, (int, float)):
+            initial_time = [initial_time] * num_players
+        if len(initial_time) != num_players:
+            raise ValueError("need one initial budget per player")
+        self.remaining = [float(budget) for budget in initial_time]
+        self.increment = increment
+        self.time_source = time_source
+        self.running_index = None
+        self.started_at = None
+
+    def start(self, player_index):
+        """
+        Start timing a move for a player. Stops any move already being timed.
+        """
+        if self.running_index is not None:
+            self.stop()
+        self.running_index = player_index
+        self.started_at = self.time_source()
+
+    def stop(self):
+        """
+        Stop timing the current move, charge it to the player and add the increment.
+        A player who has run out of time keeps a non-positive budget and gets no increment.
+        :return: Seconds used for the move.
+        """
+        if self.running_index is None:
+            return 0.0
+        elapsed = self.time_source() - self.started_at
+        self.remaining[self.running_index] -= elapsed
+        if self.remaining[self.running_index] > 0:
+            self.remaining[self.running_index] += self.increment
+        self.running_index = None
+        self.started_at = None
+        return elapsed
+
+    def time_left(self, player_index):
+        """
+        Get a player's remaining budget, including the move currently being timed.
+        """
+        left = self.remaining[player_index]
+        if player_index == self.running_index:
+            left -= self.time_source() - self.started_at
+        return left
+
+    def is_flagged(self, player_index):
+        """
+        Check if a player has exhausted their budget.
+        """
+        return self.time_left(player_index) <= 0
+
+
+class TimeManager:
+    def __init__(self, safety_margin=0.05, max_fraction=0.5, hard_multiplier=3.0, phase_weights=None):
+        """
+        Initialize the time manager.
+        :param safety_margin: Seconds always kept in reserve on the clock.
+        :param max_fraction: Largest share of the remaining budget a single move may use.
+        :param hard_multiplier: Hard limit as a multiple of the soft target.
+        :param phase_weights: Optional dict overriding the per-phase multipliers.
+        """
+        self.safety_margin = safety_margin
+        self.max_fraction = max_fraction
+        self.hard_multiplier = hard_multiplier
+        self.phase_weights = {OPENING: 0.5, MIDDLEGAME: 1.5, ENDGAME: 0.75}
+        if phase_weights:
+            self.phase_weights.update(phase_weights)
+
+    def classify_phase(self, game_logic, valid_moves=None, deadline=None):
+        """
+        Classify the position.
+        Opening: no square has two sides yet, so every move is safe.
+        Endgame: every move gives away or takes a square (only chains remain).
+        Middlegame: everything else, and the answer when the scan runs past the deadline.
+        :param valid_moves: Optional precomputed list of valid moves.
+        :param deadline: Optional time.monotonic() value at which the scan gives up.
+        :return: OPENING, MIDDLEGAME or ENDGAME.
+        """
+        if valid_moves is None:
+            valid_moves = game_logic.iter_valid_moves()
+        sides = {}
+        has_safe_move = False
+        for start, end in valid_moves:
+            if deadline is not None and time.monotonic() >= deadline:
+                return MIDDLEGAME
+            safe = True
+            for square in game_logic.squares_adjacent_to(start, end):
+                if square not in sides:
+                    sides[square] = game_logic.count_sides(*square)
+                if sides[square] >= 2:
+                    safe = False
+            if safe:
+                has_safe_move = True
+        if not has_safe_move:
+            return ENDGAME
+        if all(count < 2 for count in sides.values()):
+            return OPENING
+        return MIDDLEGAME
+
+    def allocate(self, game_logic, player_index=None, valid_moves=None, started=None):
+        """
+        Decide how long the player to move may think.
+        The phase scan is itself bounded to PHASE_SCAN_SHARE of the smallest hard limit
+        this position could get, so allocating never eats the budget it hands out.
+        :param player_index: Seat to budget for (defaults to the current player).
+        :param valid_moves: Optional precomputed list of valid moves.
+        :param started: time.monotonic() value at which the move started (defaults to now).
+        :return: Tuple (soft, hard) in seconds, measured from started, or None for untimed games.
+        """
+        clock = game_logic.clock
+        if clock is None:
+            return None
+        if started is None:
+            started = time.monotonic()
+        if player_index is None:
+            player_index = game_logic.current_player_index
+        if valid_moves is None:
+            moves_left = game_logic.count_valid_moves()
+        else:
+            moves_left = len(valid_moves)
+        usable = clock.time_left(player_index) - self.safety_margin
+        if usable <= 0 or moves_left <= 1:
+            return 0.0, max(usable, 0.0)
+        # Rough share of the remaining moves that this player will make
+        own_moves_left = max(1.0, moves_left / len(game_logic.players))
+        base = usable / own_moves_left + clock.increment
+        cap = min(usable * self.max_fraction + clock.increment, usable)
+        smallest_hard = min(base * min(self.phase_weights.values()) * self.hard_multiplier, cap)
+        phase = self.classify_phase(game_logic, valid_moves, started + PHASE_SCAN_SHARE * smallest_hard)
+        soft = base * self.phase_weights[phase]
+        hard = min(soft * self.hard_multiplier, cap)
+        return min(soft, hard), hard
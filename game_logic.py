@@ -1,14 +1,38 @@
+import time
+
+# Move categories, from the mover's point of view
+COMPLETING = "completing"    # Finishes at least one square
+SAFE = "safe"                # Gives no square a third side
+SACRIFICING = "sacrificing"  # Hands the opponent a three-sided square
+
+
+def category_for_sides(counts):
+    """
+    Categorize a move from the current side counts of the squares it borders.
+    Shared by GameLogic.classify_move and the tiled evaluator.
+    :param counts: Drawn sides of each neighbouring square, before the move.
+    :return: COMPLETING, SACRIFICING or SAFE.
+    """
+    if 3 in counts:
+        return COMPLETING
+    if 2 in counts:
+        return SACRIFICING
+    return SAFE
+
+
 class GameLogic:
-    def __init__(self, grid, players):
+    def __init__(self, grid, players, clock=None):
         """
         Initialize the game logic with a grid and players.
         :param grid: The Grid instance.
         :param players: List of Player instances.
+        :param clock: Optional GameClock enforcing per-player time budgets.
         """
         self.grid = grid
         self.players = players
         self.current_player_index = 0
         self.completed_squares = set()  # Track completed squares by top-left corner
+        self.clock = clock
 
     def get_current_player(self):
         """
@@ -23,6 +47,22 @@ class GameLogic:
         """
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
 
+    def start_clock(self):
+        """
+        Start the clock for the current player, if the game is timed.
+        """
+        if self.clock is not None:
+            self.clock.start(self.current_player_index)
+
+    def stop_clock(self):
+        """
+        Stop the running clock, if the game is timed.
+        :return: Seconds used for the move, or 0.0 for untimed games.
+        """
+        if self.clock is None:
+            return 0.0
+        return self.clock.stop()
+
     def check_for_squares(self, start, end):
         """
         Check if adding a line completes any squares.
@@ -31,27 +71,17 @@ class GameLogic:
         :return: Number of squares completed by this line.
         """
         squares_completed = 0
-        x1, y1 = start
-        x2, y2 = end
-
-        # Determine potential squares to check based on the line orientation
-        potential_squares = []
-
-        if x1 == x2:  # Vertical line
-            # Check squares to the left and right
-            potential_squares.append((min(x1, x2) - 1, min(y1, y2)))  # Left
-            potential_squares.append((min(x1, x2), min(y1, y2)))      # Right
-        elif y1 == y2:  # Horizontal line
-            # Check squares above and below
-            potential_squares.append((min(x1, x2), min(y1, y2) - 1))  # Above
-            potential_squares.append((min(x1, x2), min(y1, y2)))      # Below
-
-        # Check each potential square
-        for top_left_x, top_left_y in potential_squares:
-            if self.is_square_complete(top_left_x, top_left_y):
-                if (top_left_x, top_left_y) not in self.completed_squares:
-                    self.completed_squares.add((top_left_x, top_left_y))
-                    squares_completed += 1
+        topology = self.grid.topology
+        edge = topology.edge_ids.get((start, end))
+        if edge is None:
+            return 0
+
+        # Check each square bordering the line
+        for box in topology.edge_boxes[edge]:
+            corner = topology.boxes[box]
+            if corner not in self.completed_squares and self._box_sides(box) == 4:
+                self.completed_squares.add(corner)
+                squares_completed += 1
 
         return squares_completed
 
@@ -62,19 +92,9 @@ class GameLogic:
         :param y: Y-coordinate of the top-left corner.
         :return: True if the square is complete, False otherwise.
         """
-        # Check if all four edges of the square exist
-        if x < 0 or y < 0 or x >= self.grid.size - 1 or y >= self.grid.size - 1:
-            return False
-
-        # Define the four edges of the square
-        top = ((x, y), (x + 1, y))
-        bottom = ((x, y + 1), (x + 1, y + 1))
-        left = ((x, y), (x, y + 1))
-        right = ((x + 1, y), (x + 1, y + 1))
-
-        # Check if all four edges exist in the grid
-        return (self.has_line(top) and self.has_line(bottom) and 
-                self.has_line(left) and self.has_line(right))
+        # Squares outside the board (or in a hole) are never complete
+        box = self.grid.topology.box_ids.get((x, y))
+        return box is not None and self._box_sides(box) == 4
 
     def has_line(self, line):
         """
@@ -82,14 +102,43 @@ class GameLogic:
         :param line: Tuple of two coordinates ((x1, y1), (x2, y2)).
         :return: True if the line exists, False otherwise.
         """
-        return line in self.grid.lines or (line[1], line[0]) in self.grid.lines
+        edge = self.grid.topology.edge_ids.get(line)
+        return edge is not None and bool(self.grid.drawn[edge])
+
+    def _box_sides(self, box):
+        """Count drawn edges of a box by id."""
+        drawn = self.grid.drawn
+        return sum(drawn[edge] for edge in self.grid.topology.box_edges[box])
+
+    def squares_adjacent_to(self, start, end):
+        """
+        Get the on-board squares that a line borders.
+        :param start: (x1,y1)
+        :param end: (x2,y2)
+        :return: List of top-left corners (one square on the border, two inside).
+        """
+        topology = self.grid.topology
+        edge = topology.edge_ids.get((start, end))
+        if edge is None:
+            return []
+        return [topology.boxes[box] for box in topology.edge_boxes[edge]]
+
+    def count_sides(self, x, y):
+        """
+        Count the drawn edges of a square.
+        :param x: X-coordinate of the top-left corner.
+        :param y: Y-coordinate of the top-left corner.
+        :return: Number of drawn edges (0-4).
+        """
+        box = self.grid.topology.box_ids.get((x, y))
+        return 0 if box is None else self._box_sides(box)
 
     def is_game_over(self):
         """
         Check if the game is over (all possible squares are completed).
         :return: True if the game is over, False otherwise.
         """
-        max_squares = (self.grid.size - 1) ** 2
+        max_squares = len(self.grid.topology.boxes)
         return len(self.completed_squares) >= max_squares
 
     def get_valid_moves(self):
@@ -97,24 +146,78 @@ class GameLogic:
         Compute all valid moves (undrawn adjacent horizontal or vertical lines).
         :return: List of tuples ((x1, y1), (x2, y2)).
         """
-        moves = []
-        size = self.grid.size
-        lines = self.grid.lines
-        # Horizontal edges
-        for y in range(size):
-            for x in range(size - 1):
-                a = (x, y)
-                b = (x + 1, y)
-                if (a, b) not in lines and (b, a) not in lines:
-                    moves.append((a, b))
-        # Vertical edges
-        for y in range(size - 1):
-            for x in range(size):
-                a = (x, y)
-                b = (x, y + 1)
-                if (a, b) not in lines and (b, a) not in lines:
-                    moves.append((a, b))
-        return moves
+        return list(self.iter_valid_moves())
+
+    def count_valid_moves(self):
+        """
+        Count the valid moves without scanning the board.
+        :return: Number of undrawn edges.
+        """
+        return self.grid.edge_count() - len(self.grid.lines)
+
+    def first_valid_move(self):
+        """
+        Get the lowest-id undrawn edge; a cheap fallback when there is no time to choose.
+        :return: Tuple ((x1, y1), (x2, y2)), or None if every line is drawn.
+        """
+        edge = self.grid.drawn.find(0)
+        return None if edge < 0 else self.grid.edge_at(edge)
+
+    def iter_valid_moves(self, region=None, deadline=None):
+        """
+        Lazily yield valid moves in get_valid_moves() order, so callers can stop early.
+        :param region: Optional (x0, y0, x1, y1) half-open range for the top/left dot of each line.
+        :param deadline: Optional time.monotonic() value; the stream ends once it has passed.
+        :return: Generator of tuples ((x1, y1), (x2, y2)).
+        """
+        topology = self.grid.topology
+        drawn = self.grid.drawn
+        if region is None:
+            for edge, line in enumerate(topology.edges):
+                if deadline is not None and time.monotonic() >= deadline:
+                    return
+                if not drawn[edge]:
+                    yield line
+            return
+        x0, y0, x1, y1 = region
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, self.grid.width), min(y1, self.grid.height)
+        edge_ids = topology.edge_ids
+        # Horizontal edges, then vertical edges
+        for dx, dy in ((1, 0), (0, 1)):
+            for y in range(y0, y1):
+                for x in range(x0, x1):
+                    if deadline is not None and time.monotonic() >= deadline:
+                        return
+                    a = (x, y)
+                    b = (x + dx, y + dy)
+                    edge = edge_ids.get((a, b))
+                    if edge is not None and not drawn[edge]:
+                        yield a, b
+
+    def classify_move(self, start, end):
+        """
+        Categorize an undrawn line by the squares it borders. Does NOT mutate game state.
+        :param start: (x1,y1)
+        :param end: (x2,y2)
+        :return: COMPLETING, SACRIFICING or SAFE.
+        """
+        topology = self.grid.topology
+        edge = topology.edge_ids.get((start, end))
+        boxes = topology.edge_boxes[edge] if edge is not None else ()
+        return category_for_sides([self._box_sides(box) for box in boxes])
+
+    def iter_moves(self, category=None, region=None, deadline=None):
+        """
+        Lazily yield valid moves of one category; next() on it stops at the first hit.
+        :param category: COMPLETING, SAFE, SACRIFICING, or None for every valid move.
+        :param region: Optional (x0, y0, x1, y1) range, as in iter_valid_moves().
+        :param deadline: Optional time.monotonic() value, as in iter_valid_moves().
+        :return: Generator of tuples ((x1, y1), (x2, y2)).
+        """
+        for start, end in self.iter_valid_moves(region, deadline):
+            if category is None or self.classify_move(start, end) == category:
+                yield start, end
 
     def will_complete_square(self, start, end):
         """
@@ -124,34 +227,15 @@ class GameLogic:
         :param end: (x2,y2)
         :return: number of squares completed by hypothetical addition.
         """
-        x1, y1 = start
-        x2, y2 = end
-        hypothetical = set(self.grid.lines)
-        hypothetical.add((start, end))
+        topology = self.grid.topology
+        edge = topology.edge_ids.get((start, end))
+        if edge is None:
+            return 0
+        drawn = self.grid.drawn
         count = 0
-        # Determine orientation and potential squares like check_for_squares but using hypothetical set
-        potential = []
-        if x1 == x2:  # vertical
-            potential.append((min(x1, x2) - 1, min(y1, y2)))
-            potential.append((min(x1, x2), min(y1, y2)))
-        elif y1 == y2:  # horizontal
-            potential.append((min(x1, x2), min(y1, y2) - 1))
-            potential.append((min(x1, x2), min(y1, y2)))
-        size = self.grid.size
-        for sx, sy in potential:
-            if sx < 0 or sy < 0 or sx >= size - 1 or sy >= size - 1:
-                continue
-            top = ((sx, sy), (sx + 1, sy))
-            bottom = ((sx, sy + 1), (sx + 1, sy + 1))
-            left = ((sx, sy), (sx, sy + 1))
-            right = ((sx + 1, sy), (sx + 1, sy + 1))
-            edges = [top, bottom, left, right]
-            complete = True
-            for e in edges:
-                if e not in hypothetical and (e[1], e[0]) not in hypothetical:
-                    complete = False
-                    break
-            if complete:
+        # A bordering square completes if its other three edges are already drawn
+        for box in topology.edge_boxes[edge]:
+            if all(drawn[other] for other in topology.box_edges[box] if other != edge):
                 count += 1
         return count
 
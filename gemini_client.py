@@ -1,11 +1,11 @@
 import os
 import re
-from typing import Optional
+from typing import Optional, Union
 
-try:
-    import google.generativeai as genai  # type: ignore
-except ImportError:  # SDK not installed yet
-    genai = None  # type: ignore
+# The Gemini SDK is slow to import, so it is loaded on the first real request
+# instead of at module import (human-only games and worker processes never pay for it).
+_genai = None
+_sdk_installed: Optional[bool] = None
 
 SYSTEM_PROMPT = (
     "You are an AI opponent for the Dots and Boxes game. "
@@ -17,7 +17,7 @@ SYSTEM_PROMPT = (
 MOVE_REGEX = re.compile(r"(\d+),(\d+)\s+(\d+),(\d+)")
 
 
-def _build_dynamic_prompt(board_size: int,
+def _build_dynamic_prompt(board_size: Union[int, str],
                            lines_drawn,
                            completed_squares,
                            player_scores,
@@ -47,16 +47,52 @@ def _build_dynamic_prompt(board_size: int,
     return "\n".join(prompt)
 
 
-def request_move(board_size: int,
+def _sdk_is_installed() -> bool:
+    """Check (once) whether the SDK can be imported, without importing it."""
+    global _sdk_installed
+    if _sdk_installed is None:
+        import importlib.util
+        try:
+            _sdk_installed = importlib.util.find_spec("google.generativeai") is not None
+        except ImportError:  # 'google' namespace package missing
+            _sdk_installed = False
+    return _sdk_installed
+
+
+def _load_sdk():
+    """Import the SDK on first use. Returns the module, or None if not installed."""
+    global _genai, _sdk_installed
+    if _genai is None and _sdk_installed is not False:
+        try:
+            import google.generativeai as genai  # type: ignore
+        except ImportError:  # SDK not installed yet
+            _sdk_installed = False
+        else:
+            _genai = genai
+            _sdk_installed = True
+    return _genai
+
+
+def is_available() -> bool:
+    """Whether a Gemini call could be attempted (API key set and SDK installed)."""
+    return bool(os.getenv("GEMINI_API_KEY")) and _sdk_is_installed()
+
+
+def request_move(board_size: Union[int, str],
                  lines_drawn,
                  completed_squares,
                  player_scores,
                  current_player: str,
-                 valid_moves):
-    """Call Gemini to get a move. Returns (start,end) or None if unavailable."""
+                 valid_moves,
+                 timeout: Optional[float] = None):
+    """Call Gemini to get a move. Returns (start,end) or None if unavailable.
+    An optional timeout (seconds) bounds the request; expiry also returns None."""
     api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key or genai is None:
+    if not api_key:
         return None  # Signal to caller to use heuristic
+    genai = _load_sdk()
+    if genai is None:
+        return None
 
     try:
         genai.configure(api_key=api_key)
@@ -64,7 +100,10 @@ def request_move(board_size: int,
         dynamic_prompt = _build_dynamic_prompt(board_size, lines_drawn, completed_squares,
                                                player_scores, current_player, valid_moves)
         full_prompt = SYSTEM_PROMPT + "\n" + dynamic_prompt
-        response = model.generate_content(full_prompt)
+        if timeout is not None:
+            response = model.generate_content(full_prompt, request_options={"timeout": timeout})
+        else:
+            response = model.generate_content(full_prompt)
         if not hasattr(response, 'text'):
             return None
         text = response.text.strip()
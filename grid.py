@@ -1,12 +1,22 @@
+from topology import get_topology
+
+
 class Grid:
-    def __init__(self, size):
+    def __init__(self, size, height=None, holes=None):
         """
         Initialize the grid with the given size.
         :param size: The number of dots along one side of the grid (e.g., size=4 for a 4x4 grid).
+                     For rectangular boards, the number of dots per row.
+        :param height: Optional number of dots per column for rectangular boards (defaults to size).
+        :param holes: Optional top-left corners of boxes removed from the board.
         """
         self.size = size
+        self.width = size
+        self.height = size if height is None else height
+        self.topology = get_topology(self.width, self.height, holes or ())
         self.lines = set()  # Stores drawn lines as tuples of coordinates
-        self.grid = [[(x, y) for x in range(size)] for y in range(size)]  # 2D list of dots
+        self.drawn = bytearray(len(self.topology.edges))  # 1 per drawn edge id, mirrors lines
+        self.grid = [[(x, y) for x in range(self.width)] for y in range(self.height)]  # 2D list of dots
 
     def add_line(self, start, end):
         """
@@ -17,6 +27,7 @@ class Grid:
         """
         if self.is_valid_line(start, end):
             self.lines.add((start, end))
+            self.drawn[self.topology.edge_ids[(start, end)]] = 1
             return True
         return False
 
@@ -27,21 +38,13 @@ class Grid:
         :param end: Tuple (x2, y2) representing the ending dot.
         :return: True if the line is valid, False otherwise.
         """
-        # Ensure the start and end points are within bounds
-        if not self.is_within_bounds(start) or not self.is_within_bounds(end):
-            return False
-
-        # Ensure the line is either horizontal or vertical and adjacent
-        x1, y1 = start
-        x2, y2 = end
-        if abs(x1 - x2) + abs(y1 - y2) != 1:  # Must be adjacent
+        # Ensure the dots are in bounds, adjacent, and border at least one box of the board
+        edge = self.topology.edge_ids.get((start, end))
+        if edge is None:
             return False
 
         # Ensure the line is not already drawn
-        if (start, end) in self.lines or (end, start) in self.lines:
-            return False
-
-        return True
+        return not self.drawn[edge]
 
     def is_within_bounds(self, point):
         """
@@ -50,7 +53,32 @@ class Grid:
         :return: True if the point is within bounds, False otherwise.
         """
         x, y = point
-        return 0 <= x < self.size and 0 <= y < self.size
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def edge_count(self):
+        """
+        Get the number of possible lines on the grid.
+        :return: Horizontal plus vertical edge count.
+        """
+        return len(self.topology.edges)
+
+    def edge_index(self, start, end):
+        """
+        Map a line to a stable integer id (horizontal edges first, row by row, then vertical).
+        Direction does not matter: (a, b) and (b, a) share an id.
+        :param start: Tuple (x1, y1) representing the starting dot.
+        :param end: Tuple (x2, y2) representing the ending dot.
+        :return: Edge id in range(edge_count()), or None if the line is not on the board.
+        """
+        return self.topology.edge_ids.get((start, end))
+
+    def edge_at(self, index):
+        """
+        Map an edge id back to its line.
+        :param index: Edge id from edge_index().
+        :return: Tuple ((x1, y1), (x2, y2)) with the top/left dot first.
+        """
+        return self.topology.edges[index]
 
     def display(self, completed_squares=None):
         """
@@ -60,12 +88,12 @@ class Grid:
         if completed_squares is None:
             completed_squares = set()
 
-        for y in range(self.size):
+        for y in range(self.height):
             # Print horizontal lines
             row = ""
-            for x in range(self.size):
+            for x in range(self.width):
                 row += "o"  # Dot
-                if x < self.size - 1:
+                if x < self.width - 1:
                     if ((x, y), (x + 1, y)) in self.lines or ((x + 1, y), (x, y)) in self.lines:
                         row += "---"  # Horizontal line
                     else:
@@ -73,18 +101,20 @@ class Grid:
             print(row)
 
             # Print vertical lines and square markers
-            if y < self.size - 1:
+            if y < self.height - 1:
                 row = ""
-                for x in range(self.size):
+                for x in range(self.width):
                     if ((x, y), (x, y + 1)) in self.lines or ((x, y + 1), (x, y)) in self.lines:
                         row += "|"  # Vertical line
                     else:
                         row += " "
                     
                     # Mark completed squares
-                    if x < self.size - 1:
+                    if x < self.width - 1:
                         if (x, y) in completed_squares:
                             row += " X "  # Completed square
+                        elif (x, y) in self.topology.holes:
+                            row += "###"  # Not part of the board
                         else:
                             row += "   "
                 print(row)
\ No newline at end of file
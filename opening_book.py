@@ -0,0 +1,264 @@
+"""
+Opening book mined from self-play.
+
+Positions from the first few plies of finished games are reduced under the
+symmetries of the board (eight for a square, four for a rectangle, fewer
+with holes) and stored, per board shape, as hex bitmasks of drawn edges
+mapped to per-move statistics. The book is a plain JSON file, so new games
+can be merged into an existing book at any time.
+
+Build or extend a book from the command line:
+    python opening_book.py --size 4 --games 500 --out book_4.json
+"""
+import argparse
+import json
+import os
+import random
+
+from ai_player import AIPlayer
+from tournament import Entrant, make_grid, play_game
+
+BOOK_VERSION = 1
+
+# Dot transforms of the rectangle/square symmetry group, with nx = width - 1, ny = height - 1.
+# The last four swap axes and only fit square boards; any transform that does not map
+# the board (including its holes) onto itself is skipped.
+_SYMMETRIES = (
+    lambda x, y, nx, ny: (x, y),
+    lambda x, y, nx, ny: (nx - x, ny - y),
+    lambda x, y, nx, ny: (nx - x, y),
+    lambda x, y, nx, ny: (x, ny - y),
+    lambda x, y, nx, ny: (ny - y, x),
+    lambda x, y, nx, ny: (y, nx - x),
+    lambda x, y, nx, ny: (y, x),
+    lambda x, y, nx, ny: (ny - y, nx - x),
+)
+
+_permutation_cache = {}
+
+
+def _edge_permutations(topology):
+    """
+    Get, for each symmetry of the board, the edge-id permutation it induces.
+    :param topology: BoardTopology of the board.
+    :return: List of lists where perms[t][edge] is the transformed edge id; perms[0] is the identity.
+    """
+    if topology.key not in _permutation_cache:
+        nx, ny = topology.width - 1, topology.height - 1
+        perms = []
+        for transform in _SYMMETRIES:
+            if not _maps_boxes(topology, transform, nx, ny):
+                continue
+            perm = []
+            for (x1, y1), (x2, y2) in topology.edges:
+                edge = topology.edge_id(transform(x1, y1, nx, ny), transform(x2, y2, nx, ny))
+                if edge is None:
+                    break
+                perm.append(edge)
+            else:
+                perms.append(perm)
+        _permutation_cache[topology.key] = perms
+    return _permutation_cache[topology.key]
+
+
+def _maps_boxes(topology, transform, nx, ny):
+    """
+    Check that a transform maps every real box onto a real box, and so every hole onto a hole.
+    Interior holes leave the edge set unchanged, so matching edges alone is not enough.
+    """
+    for x, y in topology.boxes:
+        (ax, ay), (bx, by) = transform(x, y, nx, ny), transform(x + 1, y + 1, nx, ny)
+        if (min(ax, bx), min(ay, by)) not in topology.box_ids:
+            return False
+    return True
+
+
+def canonical_position(topology, edges):
+    """
+    Reduce a position to its symmetry-canonical form.
+    :param topology: BoardTopology of the board.
+    :param edges: Iterable of drawn edge ids.
+    :return: Tuple (mask, symmetry indexes) where mask is the smallest transformed bitmask
+             and the list holds every symmetry index that produces it.
+    """
+    edges = list(edges)
+    best, transforms = None, []
+    for t, perm in enumerate(_edge_permutations(topology)):
+        mask = 0
+        for edge in edges:
+            mask |= 1 << perm[edge]
+        if best is None or mask < best:
+            best, transforms = mask, [t]
+        elif mask == best:
+            transforms.append(t)
+    return best, transforms
+
+
+def seat_result(scores, seat):
+    """
+    Result for one seat: 1.0 for a sole top score, 0.5 if shared, 0.0 otherwise.
+    """
+    best_other = max(score for i, score in enumerate(scores) if i != seat)
+    if scores[seat] > best_other:
+        return 1.0
+    if scores[seat] == best_other:
+        return 0.5
+    return 0.0
+
+
+class OpeningBook:
+    def __init__(self, max_plies=8, min_games=5):
+        """
+        Initialize an empty book.
+        :param max_plies: Only positions with fewer drawn lines than this are stored.
+        :param min_games: Games a move needs before lookup() will play it.
+        """
+        self.max_plies = max_plies
+        self.min_games = min_games
+        # Self-play games build_book() has added so far; later builds continue the seed sequence
+        self.games = 0
+        # board shape key -> position key -> canonical edge id -> [games, total result]
+        self.positions = {}
+
+    def add_game(self, topology, moves, scores):
+        """
+        Record the opening of a finished game.
+        :param topology: BoardTopology of the board the game was played on (Grid.topology).
+        :param moves: List of (seat, start, end) in play order.
+        :param scores: Final scores, one per seat.
+        """
+        perms = _edge_permutations(topology)
+        table = self.positions.setdefault(topology.key, {})
+        drawn = []
+        for seat, start, end in moves[:self.max_plies]:
+            mask, transforms = canonical_position(topology, drawn)
+            edge = topology.edge_id(start, end)
+            # Symmetries that keep the position fixed also make moves equivalent; store the smallest
+            canonical_edge = min(perms[t][edge] for t in transforms)
+            stats = table.setdefault(format(mask, "x"), {}).setdefault(canonical_edge, [0, 0.0])
+            stats[0] += 1
+            stats[1] += seat_result(scores, seat)
+            drawn.append(edge)
+
+    def merge(self, other):
+        """
+        Fold another book's statistics into this one.
+        :param other: OpeningBook built with any settings.
+        """
+        self.games += other.games
+        for shape, table in other.positions.items():
+            mine = self.positions.setdefault(shape, {})
+            for key, entries in table.items():
+                position = mine.setdefault(key, {})
+                for edge, (games, total) in entries.items():
+                    stats = position.setdefault(edge, [0, 0.0])
+                    stats[0] += games
+                    stats[1] += total
+
+    def lookup(self, game_logic):
+        """
+        Find the best book move for the current position, without mutating state.
+        :param game_logic: The GameLogic instance.
+        :return: Tuple ((x1, y1), (x2, y2)) or None if the position is out of book.
+        """
+        grid = game_logic.grid
+        if len(grid.lines) >= self.max_plies:
+            return None
+        topology = grid.topology
+        table = self.positions.get(topology.key)
+        if not table:
+            return None
+        mask, transforms = canonical_position(topology, (topology.edge_id(a, b) for a, b in grid.lines))
+        entries = table.get(format(mask, "x"))
+        if not entries:
+            return None
+        candidates = [(total / games, games, edge) for edge, (games, total) in entries.items()
+                      if games >= self.min_games]
+        if not candidates:
+            return None
+        _, _, canonical_edge = max(candidates)
+        return grid.edge_at(_edge_permutations(topology)[transforms[0]].index(canonical_edge))
+
+    def save(self, path):
+        """
+        Write the book to a JSON file.
+        """
+        data = {
+            "version": BOOK_VERSION,
+            "max_plies": self.max_plies,
+            "min_games": self.min_games,
+            "games": self.games,
+            "boards": {
+                shape: {key: {str(edge): stats for edge, stats in entries.items()}
+                        for key, entries in table.items()}
+                for shape, table in self.positions.items()
+            },
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a book written by save().
+        :return: OpeningBook instance.
+        """
+        with open(path) as f:
+            data = json.load(f)
+        version = data.get("version")
+        if version != BOOK_VERSION:
+            raise ValueError(f"unsupported opening book version: {version}")
+        book = cls(data["max_plies"], data["min_games"])
+        book.games = data["games"]
+        for shape, table in data["boards"].items():
+            book.positions[shape] = {
+                key: {int(edge): stats for edge, stats in entries.items()}
+                for key, entries in table.items()
+            }
+        return book
+
+
+def build_book(board, games, book=None, max_plies=8, seed=0, entrants=None):
+    """
+    Play self-play games and mine their openings into a book.
+    :param board: Board spec, as in tournament.make_grid().
+    :param games: Number of games to play.
+    :param book: Existing OpeningBook to extend; a new one is created if None.
+    :param max_plies: Opening depth for a new book.
+    :param seed: Seed for per-game seeds. Game n of a book always gets the same seed, so
+                 extending a book continues the sequence instead of replaying earlier games.
+    :param entrants: Optional list of Entrant seats; defaults to two heuristic AIPlayers.
+    :return: The updated OpeningBook.
+    """
+    if book is None:
+        book = OpeningBook(max_plies)
+    if entrants is None:
+        entrants = [Entrant("AI 1", AIPlayer), Entrant("AI 2", AIPlayer)]
+    topology = make_grid(board).topology
+    for index in range(book.games, book.games + games):
+        game_seed = random.Random(f"{seed}:{index}").getrandbits(32)
+        result = play_game(board, entrants, seed=game_seed)
+        book.add_game(topology, result["moves"], result["scores"])
+        book.games += 1
+    return book
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or extend an opening book from self-play.")
+    parser.add_argument("--size", type=int, default=4, help="grid size (dots per side, or per row)")
+    parser.add_argument("--height", type=int, help="dots per column for rectangular boards")
+    parser.add_argument("--games", type=int, default=500, help="self-play games to add")
+    parser.add_argument("--plies", type=int, default=8, help="opening depth for a new book")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="opening_book.json", help="book file (merged into if it exists)")
+    args = parser.parse_args()
+
+    book = OpeningBook.load(args.out) if os.path.exists(args.out) else None
+    board = args.size if args.height is None else (args.size, args.height)
+    book = build_book(board, args.games, book, args.plies, args.seed)
+    book.save(args.out)
+    print(f"Saved {sum(len(t) for t in book.positions.values())} positions to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
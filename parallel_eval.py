@@ -0,0 +1,150 @@
+"""
+Tiled, multi-process move classification for very large boards.
+
+The drawn/undrawn state of every edge is written into one shared-memory byte
+array (one byte per edge id, see Grid.edge_index). The board is split into
+square tiles of dots; each worker process attaches to the shared array,
+rebuilds the (cached) board topology from its shape, classifies the undrawn
+edges whose top/left dot lies in its tile and returns edge ids, which are
+merged back into move lists in the parent. With a deadline, tiles that are
+not finished in time are left out of the result.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from multiprocessing import shared_memory
+
+from game_logic import COMPLETING, SAFE, SACRIFICING, category_for_sides
+from topology import get_topology
+
+
+def _classify_edges(drawn, topology, tile, deadline=None):
+    """
+    Classify the undrawn edges starting inside one tile.
+    :param drawn: Buffer with one byte per edge id (non-zero = drawn).
+    :param topology: BoardTopology of the board.
+    :param tile: (x0, y0, x1, y1) half-open range of top/left dots.
+    :param deadline: Optional time.monotonic() value; rows not started by then are skipped.
+    :return: Dict mapping category to a list of edge ids.
+    """
+    result = {COMPLETING: [], SAFE: [], SACRIFICING: []}
+    edge_ids = topology.edge_ids
+    edge_boxes = topology.edge_boxes
+    box_edges = topology.box_edges
+    x0, y0, x1, y1 = tile
+    for y in range(y0, y1):
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        for x in range(x0, x1):
+            # Horizontal edge to the right and vertical edge downward
+            for end in ((x + 1, y), (x, y + 1)):
+                edge = edge_ids.get(((x, y), end))
+                if edge is None or drawn[edge]:
+                    continue
+                counts = [sum(drawn[e] for e in box_edges[box]) for box in edge_boxes[edge]]
+                result[category_for_sides(counts)].append(edge)
+    return result
+
+
+def _classify_tile(job):
+    """
+    Worker entry point: attach to the shared board and classify one tile.
+    Workers stop at the move deadline too, so late tiles do not hold up the next move's jobs
+    or read the shared board after the parent has moved on.
+    """
+    shm_name, shape, tile, deadline = job
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        return _classify_edges(shm.buf, get_topology(*shape), tile, deadline)
+    finally:
+        shm.close()
+
+
+class TiledEvaluator:
+    def __init__(self, workers=None, tile_size=32, min_size=40):
+        """
+        Initialize the evaluator. Worker processes start lazily on first use.
+        :param workers: Worker process count (defaults to the CPU count).
+        :param tile_size: Dots per tile side.
+        :param min_size: Boards smaller than this are classified in-process.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.tile_size = tile_size
+        self.min_size = min_size
+        self.executor = None
+        self.shm = None
+
+    def tiles(self, width, height=None):
+        """
+        Split a board into tiles.
+        :param width: Dots per row.
+        :param height: Dots per column (defaults to width).
+        :return: List of (x0, y0, x1, y1) dot ranges covering the grid.
+        """
+        if height is None:
+            height = width
+        step = self.tile_size
+        return [(x, y, min(x + step, width), min(y + step, height))
+                for y in range(0, height, step) for x in range(0, width, step)]
+
+    def classify(self, game_logic, deadline=None):
+        """
+        Classify every valid move on the board.
+        :param game_logic: The GameLogic instance.
+        :param deadline: Optional time.monotonic() value. Moves not classified by then are
+                         missing from the result, which is empty if the deadline has passed.
+        :return: Dict mapping COMPLETING, SAFE and SACRIFICING to lists of moves.
+        """
+        grid = game_logic.grid
+        topology = grid.topology
+        merged = {COMPLETING: [], SAFE: [], SACRIFICING: []}
+        if deadline is not None and time.monotonic() >= deadline:
+            return merged
+        if max(grid.width, grid.height) < self.min_size or self.workers < 2:
+            merged = _classify_edges(grid.drawn, topology, (0, 0, grid.width, grid.height), deadline)
+        else:
+            buf = self._shared_board(grid.edge_count())
+            buf[:grid.edge_count()] = grid.drawn
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(self.workers)
+            shape = (topology.width, topology.height, topology.holes)
+            jobs = [(self.shm.name, shape, tile, deadline)
+                    for tile in self.tiles(grid.width, grid.height)]
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            try:
+                # Tiles come back in order; on timeout keep the ones already merged
+                for part in self.executor.map(_classify_tile, jobs, timeout=timeout):
+                    for category, edges in part.items():
+                        merged[category].extend(edges)
+            except FuturesTimeoutError:
+                pass
+        return {category: [grid.edge_at(edge) for edge in edges]
+                for category, edges in merged.items()}
+
+    def _shared_board(self, edge_count):
+        """Get a shared buffer large enough for edge_count bytes, reallocating if needed."""
+        if self.shm is None or self.shm.size < edge_count:
+            self._release_shared_board()
+            self.shm = shared_memory.SharedMemory(create=True, size=edge_count)
+        return self.shm.buf
+
+    def _release_shared_board(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    def close(self):
+        """
+        Stop worker processes and free the shared board.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        self._release_shared_board()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
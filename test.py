@@ -59,5 +59,18 @@ class TestGrid(unittest.TestCase):
         self.assertFalse(self.grid.is_within_bounds((4, 4)))  # Out of bounds
         self.assertFalse(self.grid.is_within_bounds((-1, 0)))  # Negative coordinates
 
+    def test_edge_index_round_trip(self):
+        """
+        Test that every edge id maps back to its line, independent of direction.
+        """
+        ids = set()
+        for index in range(self.grid.edge_count()):
+            start, end = self.grid.edge_at(index)
+            self.assertTrue(self.grid.is_valid_line(start, end))
+            self.assertEqual(self.grid.edge_index(start, end), index)
+            self.assertEqual(self.grid.edge_index(end, start), index)
+            ids.add((start, end))
+        self.assertEqual(len(ids), 24)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,8 +1,14 @@
+import os
+import subprocess
+import sys
+import types
 import unittest
+from unittest import mock
+import gemini_client
 from grid import Grid
 from player import Player
 from ai_player import AIPlayer
-from game_logic import GameLogic
+from game_logic import GameLogic, SAFE
 
 class TestAI(unittest.TestCase):
     def setUp(self):
@@ -36,5 +42,54 @@ class TestAI(unittest.TestCase):
         count = self.logic.will_complete_square((0,1),(1,1))
         self.assertEqual(count, 1)
 
+    def test_ai_classifies_each_move_once(self):
+        # No capture available: one pass over the board picks a safe move
+        self.grid.add_line((0,0),(1,0))
+        classify = mock.Mock(wraps=self.logic.classify_move)
+        with mock.patch.object(self.logic, "classify_move", classify), \
+                mock.patch("ai_player.gemini_available", return_value=False):
+            move = self.p1.choose_move(self.logic)
+        self.assertEqual(classify.call_count, len(self.logic.get_valid_moves()))
+        self.assertEqual(self.logic.classify_move(*move), SAFE)
+
+class FakeModel:
+    def __init__(self, name):
+        self.name = name
+
+    def generate_content(self, prompt, **kwargs):
+        return types.SimpleNamespace(text="0,0 1,0")
+
+
+class TestGeminiLazyImport(unittest.TestCase):
+    def tearDown(self):
+        gemini_client._genai = None
+        gemini_client._sdk_installed = None
+
+    def test_import_does_not_load_sdk(self):
+        code = "import sys, main, ai_player; print('google.generativeai' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+        self.assertEqual(output.strip(), "False")
+
+    def test_sdk_loaded_on_first_request(self):
+        fake_sdk = types.ModuleType("google.generativeai")
+        fake_sdk.configure = lambda api_key: None
+        fake_sdk.GenerativeModel = FakeModel
+        fake_google = types.ModuleType("google")
+        fake_google.generativeai = fake_sdk
+        modules = {"google": fake_google, "google.generativeai": fake_sdk}
+        with mock.patch.dict(sys.modules, modules), \
+                mock.patch.dict(os.environ, {"GEMINI_API_KEY": "test"}):
+            self.assertIsNone(gemini_client._genai)
+            move = gemini_client.request_move(3, [], [], {"AI": 0}, "AI", [((0, 0), (1, 0))])
+        self.assertEqual(move, ((0, 0), (1, 0)))
+        self.assertIs(gemini_client._genai, fake_sdk)
+
+    def test_no_key_skips_sdk(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertFalse(gemini_client.is_available())
+            self.assertIsNone(gemini_client.request_move(3, [], [], {}, "AI", []))
+        self.assertIsNone(gemini_client._genai)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,151 @@
+import unittest
+from unittest import mock
+from grid import Grid
+from player import Player
+from ai_player import AIPlayer
+from game_logic import GameLogic
+from clock import GameClock, TimeManager, OPENING, MIDDLEGAME, ENDGAME
+
+
+class FakeTime:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TickingTime(FakeTime):
+    """Time source that advances by a fixed step on every read."""
+
+    def __init__(self, step):
+        super().__init__()
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+class TestGameClock(unittest.TestCase):
+    def setUp(self):
+        self.time = FakeTime()
+        self.clock = GameClock(2, 10.0, increment=1.0, time_source=self.time)
+
+    def test_stop_charges_elapsed_and_adds_increment(self):
+        self.clock.start(0)
+        self.time.now = 3.0
+        self.assertAlmostEqual(self.clock.time_left(0), 7.0)
+        self.assertAlmostEqual(self.clock.stop(), 3.0)
+        self.assertAlmostEqual(self.clock.time_left(0), 8.0)
+        self.assertAlmostEqual(self.clock.time_left(1), 10.0)
+
+    def test_flagged_player_gets_no_increment(self):
+        self.clock.start(1)
+        self.time.now = 12.0
+        self.clock.stop()
+        self.assertTrue(self.clock.is_flagged(1))
+        self.assertAlmostEqual(self.clock.time_left(1), -2.0)
+
+    def test_per_player_budgets(self):
+        clock = GameClock(2, [5.0, 20.0])
+        self.assertEqual(clock.remaining, [5.0, 20.0])
+        with self.assertRaises(ValueError):
+            GameClock(3, [5.0, 20.0])
+
+    def test_game_logic_clock_hooks(self):
+        logic = GameLogic(Grid(3), [Player("A"), Player("B")], self.clock)
+        logic.start_clock()
+        self.time.now = 2.0
+        self.assertAlmostEqual(logic.stop_clock(), 2.0)
+        self.assertEqual(GameLogic(Grid(3), [Player("A")]).stop_clock(), 0.0)
+
+
+class TestTimeManager(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid(3)
+        self.time = FakeTime()
+        self.clock = GameClock(2, 60.0, time_source=self.time)
+        self.logic = GameLogic(self.grid, [AIPlayer("A"), AIPlayer("B")], self.clock)
+        self.manager = TimeManager()
+
+    def test_phases(self):
+        self.assertEqual(self.manager.classify_phase(self.logic), OPENING)
+        self.grid.add_line((0, 0), (1, 0))
+        self.grid.add_line((0, 0), (0, 1))
+        self.assertEqual(self.manager.classify_phase(self.logic), MIDDLEGAME)
+        # Two sides on every square: any further move hands over a square
+        self.grid.add_line((1, 1), (2, 1))
+        self.grid.add_line((2, 1), (2, 2))
+        self.grid.add_line((1, 0), (2, 0))
+        self.grid.add_line((0, 2), (1, 2))
+        self.grid.add_line((0, 1), (0, 2))
+        self.assertEqual(self.manager.classify_phase(self.logic), ENDGAME)
+
+    def test_middlegame_gets_more_time_than_opening(self):
+        opening_soft, _ = self.manager.allocate(self.logic)
+        self.grid.add_line((0, 0), (1, 0))
+        self.grid.add_line((0, 0), (0, 1))
+        middle_soft, middle_hard = self.manager.allocate(self.logic)
+        self.assertGreater(middle_soft, opening_soft)
+        self.assertLessEqual(middle_soft, middle_hard)
+        self.assertLessEqual(middle_hard, 60.0 * self.manager.max_fraction)
+
+    def test_untimed_and_exhausted(self):
+        self.assertIsNone(self.manager.allocate(GameLogic(Grid(3), [Player("A"), Player("B")])))
+        self.clock.start(0)
+        self.time.now = 61.0
+        self.assertEqual(self.manager.allocate(self.logic), (0.0, 0.0))
+
+    def test_ai_with_time_manager_returns_valid_move(self):
+        ai = AIPlayer("Timed", time_manager=self.manager)
+        self.logic.players[0] = ai
+        move = ai.choose_move(self.logic)
+        self.assertIn(move, self.logic.get_valid_moves())
+
+    def test_remote_timeout_ends_by_hard_deadline(self):
+        # Capped budget: the soft target equals the hard limit
+        manager = TimeManager(max_fraction=0.05)
+        soft, hard = manager.allocate(self.logic)
+        self.assertEqual(soft, hard)
+        ai = AIPlayer("Timed", time_manager=manager)
+        self.logic.players[0] = ai
+        ticking = TickingTime(0.01)
+        calls = []
+
+        def request_move(**kwargs):
+            calls.append((ticking.now, kwargs["timeout"]))
+            return None
+
+        with mock.patch("time.monotonic", ticking), \
+                mock.patch("ai_player.gemini_available", return_value=True), \
+                mock.patch("ai_player.request_move", request_move):
+            ai.choose_move(self.logic)
+        (sent_at, timeout), = calls
+        # The move started at the first clock read; allow float rounding only
+        self.assertLessEqual(sent_at + timeout, ticking.step + hard + 1e-9)
+        self.assertLess(timeout, soft)
+
+    def test_move_past_hard_limit_plays_first_valid_move(self):
+        grid = Grid(100)
+        for y in range(100):
+            for x in range(99):
+                grid.add_line((x, y), (x + 1, y))
+        # Every clock read costs 10 microseconds, so only time reads move the clock forward
+        ticking = TickingTime(1e-5)
+        ai = AIPlayer("Timed", time_manager=self.manager)
+        logic = GameLogic(grid, [ai, AIPlayer("B")], GameClock(2, 0.2, time_source=ticking))
+        logic.start_clock()
+        classify = mock.Mock(wraps=logic.classify_move)
+        with mock.patch("time.monotonic", ticking), mock.patch.object(logic, "classify_move", classify):
+            move = ai.choose_move(logic)
+        # Allocation and every scan stop at the deadline instead of walking the board
+        self.assertEqual(move, logic.first_valid_move())
+        self.assertLess(classify.call_count, 10)
+        self.assertLess(ticking.now, 0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
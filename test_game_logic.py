@@ -0,0 +1,48 @@
+import unittest
+from grid import Grid
+from player import Player
+from game_logic import GameLogic, COMPLETING, SAFE, SACRIFICING
+
+
+def draw_classification_fixture(grid):
+    """
+    Draw three sides of square (0,0) and two sides of square (2,2), so the board has
+    one completing move, sacrificing moves around both squares and safe moves elsewhere.
+    Shared with test_parallel_eval.py.
+    """
+    for start, end in [((0, 0), (1, 0)), ((0, 0), (0, 1)), ((1, 0), (1, 1)),
+                       ((2, 2), (3, 2)), ((2, 3), (3, 3))]:
+        grid.add_line(start, end)
+
+
+class TestMoveStreams(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid(4)
+        self.logic = GameLogic(self.grid, [Player("A"), Player("B")])
+        draw_classification_fixture(self.grid)
+
+    def test_iter_valid_moves_matches_list(self):
+        self.assertEqual(list(self.logic.iter_valid_moves()), self.logic.get_valid_moves())
+        self.assertEqual(len(self.logic.get_valid_moves()), 24 - 5)
+
+    def test_classify_move(self):
+        self.assertEqual(self.logic.classify_move((0, 1), (1, 1)), COMPLETING)
+        self.assertEqual(self.logic.classify_move((2, 2), (2, 3)), SACRIFICING)
+        self.assertEqual(self.logic.classify_move((3, 0), (3, 1)), SAFE)
+
+    def test_iter_moves_by_category(self):
+        self.assertEqual(next(self.logic.iter_moves(COMPLETING)), ((0, 1), (1, 1)))
+        categories = {}
+        for move in self.logic.iter_valid_moves():
+            categories.setdefault(self.logic.classify_move(*move), []).append(move)
+        for category in (COMPLETING, SAFE, SACRIFICING):
+            self.assertEqual(list(self.logic.iter_moves(category)), categories[category])
+
+    def test_iter_moves_in_region(self):
+        moves = list(self.logic.iter_moves(region=(2, 2, 4, 4)))
+        self.assertEqual(moves, [((2, 2), (2, 3)), ((3, 2), (3, 3))])
+        self.assertIsNone(next(self.logic.iter_moves(COMPLETING, region=(2, 2, 4, 4)), None))
+
+
+if __name__ == '__main__':
+    unittest.main()
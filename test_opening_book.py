@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from grid import Grid
+from player import Player
+from ai_player import AIPlayer
+from game_logic import GameLogic
+from opening_book import OpeningBook, build_book, canonical_position, _edge_permutations
+from topology import get_topology
+
+
+class TestOpeningBook(unittest.TestCase):
+    def setUp(self):
+        self.book = OpeningBook(max_plies=4, min_games=1)
+
+    def test_symmetric_positions_share_a_key(self):
+        topology = get_topology(4)
+        corners = [((0, 0), (1, 0)), ((2, 0), (3, 0)), ((3, 2), (3, 3)), ((0, 3), (1, 3))]
+        keys = {canonical_position(topology, [topology.edge_id(a, b)])[0] for a, b in corners}
+        self.assertEqual(len(keys), 1)
+
+    def test_rectangular_board_has_no_diagonal_symmetry(self):
+        topology = get_topology(4, 3)
+        top = canonical_position(topology, [topology.edge_id((0, 0), (1, 0))])[0]
+        bottom = canonical_position(topology, [topology.edge_id((2, 2), (3, 2))])[0]
+        side = canonical_position(topology, [topology.edge_id((0, 0), (0, 1))])[0]
+        self.assertEqual(top, bottom)
+        self.assertNotEqual(top, side)
+
+    def test_interior_hole_limits_symmetries(self):
+        # Off-centre hole: every edge still exists, but only the diagonal mirror keeps the hole
+        topology = get_topology(5, 5, [(1, 1)])
+        box = [topology.edge_id(a, b) for a, b in [((2, 1), (3, 1)), ((2, 2), (3, 2)), ((2, 1), (2, 2))]]
+        hole = [topology.edge_id(a, b) for a, b in [((1, 1), (2, 1)), ((1, 2), (2, 2)), ((2, 1), (2, 2))]]
+        self.assertEqual(len(_edge_permutations(topology)), 2)
+        self.assertNotEqual(canonical_position(topology, box)[0], canonical_position(topology, hole)[0])
+
+    def test_symmetric_moves_share_an_entry(self):
+        topology = get_topology(3)
+        for start, end in topology.edges:
+            self.book.add_game(topology, [(0, start, end)], [1, 3])
+        # Every first move on an empty 3x3 board is an outer or an inner edge
+        entries = self.book.positions["3x3"]["0"]
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(sorted(games for games, _ in entries.values()), [4, 8])
+
+    def test_lookup_maps_move_back_through_symmetry(self):
+        # Recorded game: top-left edge, then the winner answered with the far top edge
+        self.book.add_game(get_topology(4), [(0, (0, 0), (1, 0)), (1, (2, 0), (3, 0))], [2, 7])
+        grid = Grid(4)
+        logic = GameLogic(grid, [Player("A"), Player("B")])
+        # Same position mirrored to the bottom-right corner
+        grid.add_line((3, 3), (2, 3))
+        self.assertEqual(self.book.lookup(logic), ((0, 3), (1, 3)))
+
+    def test_lookup_prefers_better_results_and_respects_min_games(self):
+        self.book.add_game(get_topology(3), [(0, (0, 0), (1, 0))], [0, 4])
+        self.book.add_game(get_topology(3), [(0, (0, 1), (1, 1))], [4, 0])
+        logic = GameLogic(Grid(3), [Player("A"), Player("B")])
+        self.assertEqual(self.book.lookup(logic), ((0, 1), (1, 1)))
+        self.book.min_games = 2
+        self.assertIsNone(self.book.lookup(logic))
+
+    def test_save_load_and_merge(self):
+        self.book.add_game(get_topology(3), [(0, (0, 0), (1, 0)), (1, (0, 0), (0, 1))], [3, 1])
+        path = os.path.join(tempfile.mkdtemp(), "book.json")
+        self.book.save(path)
+        loaded = OpeningBook.load(path)
+        self.assertEqual(loaded.positions, self.book.positions)
+        loaded.merge(self.book)
+        entries = next(iter(loaded.positions["3x3"].values()))
+        games, _ = next(iter(entries.values()))
+        self.assertEqual(games, 2)
+
+    def test_ai_plays_book_move(self):
+        book = build_book(3, 20, OpeningBook(max_plies=3, min_games=1))
+        grid = Grid(3)
+        ai = AIPlayer("Book", opening_book=book)
+        logic = GameLogic(grid, [ai, Player("Human")])
+        self.assertEqual(ai.choose_move(logic), book.lookup(logic))
+        self.assertIsNotNone(book.lookup(logic))
+
+    def test_extending_a_book_plays_new_games(self):
+        extended = build_book(3, 5, OpeningBook(max_plies=3, min_games=1))
+        path = os.path.join(tempfile.mkdtemp(), "book.json")
+        extended.save(path)
+        extended = build_book(3, 5, OpeningBook.load(path))
+        fresh = build_book(3, 10, OpeningBook(max_plies=3, min_games=1))
+        self.assertEqual(extended.games, 10)
+        self.assertEqual(extended.positions, fresh.positions)
+
+    def test_rectangular_book(self):
+        book = build_book((4, 3), 10, OpeningBook(max_plies=2, min_games=1))
+        logic = GameLogic(Grid(4, 3), [Player("A"), Player("B")])
+        self.assertIn(book.lookup(logic), logic.get_valid_moves())
+        self.assertIsNone(book.lookup(GameLogic(Grid(4), [Player("A"), Player("B")])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import time
+import unittest
+from grid import Grid
+from player import Player
+from ai_player import AIPlayer
+from game_logic import GameLogic
+from parallel_eval import TiledEvaluator, COMPLETING, SAFE, SACRIFICING, _classify_tile
+from test_game_logic import draw_classification_fixture
+
+
+class TestTiledEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid(6)
+        self.ai = AIPlayer("AI")
+        self.logic = GameLogic(self.grid, [self.ai, Player("Human")])
+        draw_classification_fixture(self.grid)
+
+    def expected(self):
+        """Classify with the serial GameLogic check."""
+        result = {COMPLETING: set(), SAFE: set(), SACRIFICING: set()}
+        for a, b in self.logic.get_valid_moves():
+            result[self.logic.classify_move(a, b)].add((a, b))
+        return result
+
+    def assert_matches_serial(self, evaluator):
+        classes = evaluator.classify(self.logic)
+        self.assertEqual({k: set(v) for k, v in classes.items()}, self.expected())
+        self.assertEqual(classes[COMPLETING], [((0, 1), (1, 1))])
+
+    def test_in_process_matches_serial(self):
+        self.assert_matches_serial(TiledEvaluator(workers=1))
+
+    def test_worker_processes_match_serial(self):
+        with TiledEvaluator(workers=2, tile_size=2, min_size=0) as evaluator:
+            self.assertEqual(len(evaluator.tiles(6)), 9)
+            self.assert_matches_serial(evaluator)
+            # Reusing the shared board after another move
+            self.grid.add_line((0, 1), (1, 1))
+            classes = evaluator.classify(self.logic)
+            self.assertEqual(classes[COMPLETING], [])
+
+    def test_deadline_stops_classification(self):
+        deadline = time.monotonic()
+        with TiledEvaluator(workers=2, tile_size=2, min_size=0) as evaluator:
+            for workers in (1, 2):
+                evaluator.workers = workers
+                classes = evaluator.classify(self.logic, deadline)
+                self.assertEqual(classes, {COMPLETING: [], SAFE: [], SACRIFICING: []})
+        ai = AIPlayer("Tiled", evaluator=TiledEvaluator(workers=1))
+        self.assertEqual(ai._tiled_heuristic_move(self.logic, deadline), self.logic.first_valid_move())
+
+    def test_worker_tile_stops_at_deadline(self):
+        with TiledEvaluator(workers=2) as evaluator:
+            buf = evaluator._shared_board(self.grid.edge_count())
+            buf[:self.grid.edge_count()] = self.grid.drawn
+            job = (evaluator.shm.name, (6, 6, frozenset()), (0, 0, 6, 6))
+            self.assertEqual(_classify_tile(job + (time.monotonic(),)),
+                             {COMPLETING: [], SAFE: [], SACRIFICING: []})
+            self.assertEqual(len(_classify_tile(job + (None,))[COMPLETING]), 1)
+
+    def test_ai_uses_evaluator(self):
+        ai = AIPlayer("Tiled", evaluator=TiledEvaluator(workers=1))
+        self.assertEqual(ai.choose_move(self.logic), ((0, 1), (1, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
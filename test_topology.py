@@ -0,0 +1,64 @@
+import unittest
+from grid import Grid
+from player import Player
+from game_logic import GameLogic
+from topology import get_topology
+from tournament import Entrant, play_game
+from ai_player import AIPlayer
+
+
+class TestTopology(unittest.TestCase):
+    def test_square_tables(self):
+        topology = get_topology(3)
+        self.assertEqual(len(topology.edges), 12)
+        self.assertEqual(len(topology.boxes), 4)
+        # Corner box edges: top, bottom, left, right
+        top, bottom, left, right = topology.box_edges[topology.box_ids[(0, 0)]]
+        self.assertEqual(topology.edges[top], ((0, 0), (1, 0)))
+        self.assertEqual(topology.edges[right], ((1, 0), (1, 1)))
+        # Border edge borders one box, inner edge two
+        self.assertEqual(len(topology.edge_boxes[top]), 1)
+        self.assertEqual(len(topology.edge_boxes[bottom]), 2)
+        self.assertEqual(topology.edge_id((1, 0), (0, 0)), top)
+        self.assertIsNone(topology.edge_id((0, 0), (1, 1)))
+
+    def test_topology_is_shared_per_shape(self):
+        self.assertIs(Grid(4).topology, Grid(4).topology)
+        self.assertIsNot(Grid(4).topology, Grid(4, 3).topology)
+        self.assertEqual(get_topology(5, 3, [(1, 1)]).key, "5x3/1,1")
+
+    def test_rectangular_board(self):
+        grid = Grid(4, 2)
+        logic = GameLogic(grid, [Player("A"), Player("B")])
+        self.assertTrue(grid.is_valid_line((3, 1), (2, 1)))
+        self.assertFalse(grid.is_valid_line((0, 1), (0, 2)))
+        self.assertEqual(len(logic.get_valid_moves()), 10)
+        for start, end in [((2, 0), (3, 0)), ((2, 1), (3, 1)), ((2, 0), (2, 1))]:
+            grid.add_line(start, end)
+        self.assertEqual(logic.will_complete_square((3, 0), (3, 1)), 1)
+        grid.add_line((3, 0), (3, 1))
+        self.assertEqual(logic.check_for_squares((3, 0), (3, 1)), 1)
+        self.assertEqual(logic.completed_squares, {(2, 0)})
+        self.assertFalse(logic.is_game_over())
+
+    def test_board_with_hole(self):
+        # 3x3 boxes with the centre box removed: its four edges still border a neighbour
+        grid = Grid(4, holes=[(1, 1)])
+        logic = GameLogic(grid, [Player("A"), Player("B")])
+        self.assertEqual(grid.edge_count(), 24)
+        self.assertFalse(logic.is_square_complete(1, 1))
+        # Corner hole removes the two outer edges of that box
+        corner = Grid(3, holes=[(0, 0)])
+        self.assertEqual(corner.edge_count(), 10)
+        self.assertFalse(corner.is_valid_line((0, 0), (1, 0)))
+        self.assertTrue(corner.is_valid_line((1, 0), (1, 1)))
+
+    def test_full_games_on_other_shapes(self):
+        entrants = [Entrant("A", AIPlayer), Entrant("B", AIPlayer)]
+        for board, boxes in [((5, 3), 8), ((4, 4, [(1, 1)]), 8)]:
+            result = play_game(board, entrants, seed=3)
+            self.assertEqual(sum(result["scores"]), boxes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import random
+import time
+import unittest
+from ai_player import AIPlayer
+from tournament import (Entrant, EloTable, PairRecord, Tournament, GAUNTLET,
+                        play_game, pairwise_score)
+
+
+class RandomAI(AIPlayer):
+    """Baseline that ignores strategy and plays any valid move."""
+
+    def choose_move(self, game_logic):
+        valid_moves = game_logic.get_valid_moves()
+        return random.choice(valid_moves) if valid_moves else None
+
+
+class SlowAI(RandomAI):
+    """Random player that thinks too long for any short time control."""
+
+    def choose_move(self, game_logic):
+        time.sleep(0.02)
+        return super().choose_move(game_logic)
+
+
+class TestTournament(unittest.TestCase):
+    def test_play_game_fills_board(self):
+        result = play_game(3, [Entrant("A", AIPlayer), Entrant("B", RandomAI)], seed=1)
+        self.assertEqual(sum(result["scores"]), 4)
+        # 3x3 dots have 12 edges, every one is drawn by the end
+        self.assertEqual(len(result["moves"]), 12)
+
+    def test_play_game_restores_global_random_state(self):
+        random.seed(42)
+        expected = random.random()
+        random.seed(42)
+        first = play_game(3, [Entrant("A", RandomAI), Entrant("B", RandomAI)], seed=7)
+        self.assertEqual(random.random(), expected)
+        # Same seed replays the same game
+        second = play_game(3, [Entrant("A", RandomAI), Entrant("B", RandomAI)], seed=7)
+        self.assertEqual(first["moves"], second["moves"])
+
+    def test_flagged_seat_loses(self):
+        entrants = [Entrant("Fast", RandomAI), Entrant("Slow", SlowAI)]
+        result = play_game(3, entrants, seed=1, time_control=(0.01, 0.0))
+        self.assertEqual(result["flagged"], 1)
+        self.assertLess(len(result["moves"]), 12)
+        self.assertIsNone(play_game(3, entrants, seed=1)["flagged"])
+        tournament = Tournament(entrants)
+        key = ("3x3", ("Fast", "Slow"))
+        tournament.record_game(key, entrants[::-1], [4, 0], flagged=0)
+        self.assertEqual(tournament.records[key][("Fast", "Slow")].wins, 1)
+
+    def test_pairwise_score(self):
+        self.assertEqual(pairwise_score(3, 1), 1.0)
+        self.assertEqual(pairwise_score(1, 3), 0.0)
+        self.assertEqual(pairwise_score(2, 2), 0.5)
+
+    def test_elo_update_is_zero_sum(self):
+        elo = EloTable(k_factor=32)
+        elo.update("A", "B", 1.0)
+        self.assertAlmostEqual(elo.rating("A"), 1516.0)
+        self.assertAlmostEqual(elo.rating("A") + elo.rating("B"), 3000.0)
+
+    def test_pair_record_settles(self):
+        record = PairRecord()
+        for _ in range(5):
+            record.add(1.0)
+        self.assertFalse(record.is_settled(1.96, min_games=10))
+        for _ in range(5):
+            record.add(1.0)
+        self.assertTrue(record.is_settled(1.96, min_games=10))
+        even = PairRecord()
+        for score in (1.0, 0.0) * 10:
+            even.add(score)
+        self.assertFalse(even.is_settled(1.96, min_games=10))
+
+    def test_single_win_does_not_settle(self):
+        record = PairRecord()
+        record.add(1.0)
+        low, high = record.interval(1.96)
+        self.assertLess(low, 0.5)
+        self.assertEqual(high, 1.0)
+        self.assertFalse(record.is_settled(1.96, min_games=1))
+
+    def test_repeated_looks_use_stricter_threshold(self):
+        entrants = [Entrant("A", AIPlayer), Entrant("B", AIPlayer)]
+        single_look = Tournament(entrants, max_games=8, batch_size=8)
+        many_looks = Tournament(entrants, max_games=200, batch_size=8)
+        self.assertAlmostEqual(single_look.z, 1.96, places=2)
+        self.assertGreater(many_looks.z, single_look.z)
+
+    def test_matchups_round_robin_and_gauntlet(self):
+        entrants = [Entrant(name, AIPlayer) for name in "ABCD"]
+        round_robin = Tournament(entrants, board_sizes=(3, 4), seats=3)
+        self.assertEqual(len(round_robin.matchups()), 8)
+        gauntlet = Tournament(entrants, mode=GAUNTLET)
+        groups = [tuple(e.name for e in group) for _, group in gauntlet.matchups()]
+        self.assertEqual(groups, [("A", "B"), ("A", "C"), ("A", "D")])
+
+    def test_invalid_seats(self):
+        with self.assertRaises(ValueError):
+            Tournament([Entrant(name, AIPlayer) for name in "ABCDE"], seats=5)
+
+    def test_run_stops_early_for_clear_result(self):
+        tournament = Tournament([Entrant("Heuristic", AIPlayer), Entrant("Random", RandomAI)],
+                                board_sizes=(4,), min_games=8, max_games=200, batch_size=8)
+        elo = tournament.run()
+        key = ("4x4", ("Heuristic", "Random"))
+        self.assertTrue(tournament.is_settled(key))
+        self.assertLess(tournament.games_played[key], 200)
+        self.assertGreater(elo.rating("Heuristic"), elo.rating("Random"))
+
+    def test_multi_seat_gauntlet_stops_on_candidate_pairs(self):
+        entrants = [Entrant("Heuristic", AIPlayer), Entrant("R1", RandomAI), Entrant("R2", RandomAI)]
+        tournament = Tournament(entrants, board_sizes=(4,), seats=3, mode=GAUNTLET,
+                                min_games=8, max_games=200, batch_size=8)
+        tournament.run()
+        key = ("4x4", ("Heuristic", "R1", "R2"))
+        self.assertTrue(tournament.is_settled(key))
+        self.assertLess(tournament.games_played[key], 200)
+
+    def test_run_board_with_holes(self):
+        entrants = [Entrant("A", RandomAI), Entrant("B", RandomAI)]
+        tournament = Tournament(entrants, board_sizes=[(4, 4, [(1, 1)])], min_games=2,
+                                max_games=2, batch_size=2)
+        tournament.run()
+        self.assertEqual(tournament.games_played[("4x4/1,1", ("A", "B"))], 2)
+
+    def test_run_multi_seat_respects_max_games(self):
+        entrants = [Entrant(name, RandomAI) for name in "ABC"]
+        tournament = Tournament(entrants, seats=3, min_games=4, max_games=6, batch_size=4)
+        tournament.run()
+        self.assertEqual(tournament.games_played[("3x3", ("A", "B", "C"))], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Board topology: precomputed edge/box adjacency for any board shape.
+
+A board is a width x height lattice of dots with an optional set of holes
+(boxes, by top-left corner, that are not part of the board). Only edges that
+border at least one real box can be drawn. The tables are built once per
+shape and shared by every Grid with that shape through get_topology().
+"""
+from functools import lru_cache
+
+
+class BoardTopology:
+    def __init__(self, width, height, holes=frozenset()):
+        """
+        Build adjacency tables for a board shape.
+        :param width: Number of dots per row.
+        :param height: Number of dots per column.
+        :param holes: Top-left corners of boxes removed from the board.
+        """
+        self.width = width
+        self.height = height
+        self.holes = frozenset(holes)
+
+        # Boxes in row-major order, identified by top-left corner
+        self.boxes = [(x, y) for y in range(height - 1) for x in range(width - 1)
+                      if (x, y) not in self.holes]
+        self.box_ids = {corner: i for i, corner in enumerate(self.boxes)}
+
+        # Edges: horizontal row by row, then vertical row by row, top/left dot first
+        candidates = [((x, y), (x + 1, y)) for y in range(height) for x in range(width - 1)]
+        candidates += [((x, y), (x, y + 1)) for y in range(height - 1) for x in range(width)]
+        self.edges = []
+        edge_boxes = []
+        for start, end in candidates:
+            bordering = tuple(self.box_ids[corner] for corner in self._bordering_corners(start, end)
+                              if corner in self.box_ids)
+            if bordering:
+                self.edges.append((start, end))
+                edge_boxes.append(bordering)
+        self.edge_boxes = tuple(edge_boxes)
+
+        # Both directions map to the same edge id
+        self.edge_ids = {}
+        for i, (start, end) in enumerate(self.edges):
+            self.edge_ids[(start, end)] = i
+            self.edge_ids[(end, start)] = i
+
+        self.box_edges = tuple(
+            (self.edge_ids[((x, y), (x + 1, y))], self.edge_ids[((x, y + 1), (x + 1, y + 1))],
+             self.edge_ids[((x, y), (x, y + 1))], self.edge_ids[((x + 1, y), (x + 1, y + 1))])
+            for x, y in self.boxes
+        )
+
+    @staticmethod
+    def _bordering_corners(start, end):
+        """Top-left corners of the two boxes a line could border (may be off-board)."""
+        (x, y), (x2, y2) = start, end
+        if y == y2:  # Horizontal: above and below
+            return (x, y - 1), (x, y)
+        return (x - 1, y), (x, y)  # Vertical: left and right
+
+    @property
+    def key(self):
+        """
+        Compact string naming the shape, e.g. '4x4' or '5x3/1,1;2,1' with holes.
+        """
+        key = f"{self.width}x{self.height}"
+        if self.holes:
+            key += "/" + ";".join(f"{x},{y}" for x, y in sorted(self.holes))
+        return key
+
+    def edge_id(self, start, end):
+        """
+        Get the id of the edge between two dots.
+        :return: Edge id, or None if the dots do not form an edge of this board.
+        """
+        return self.edge_ids.get((start, end))
+
+
+@lru_cache(maxsize=None)
+def _cached_topology(width, height, holes):
+    return BoardTopology(width, height, holes)
+
+
+def get_topology(width, height=None, holes=()):
+    """
+    Get the shared topology for a board shape, building it on first use.
+    :param width: Number of dots per row.
+    :param height: Number of dots per column (defaults to width).
+    :param holes: Iterable of removed box corners.
+    :return: BoardTopology instance.
+    """
+    return _cached_topology(width, width if height is None else height, frozenset(holes))
@@ -0,0 +1,365 @@
+"""
+Tournament runner for comparing AI player variants.
+
+Schedules round-robin or gauntlet matchups across board sizes and 2-4 seats,
+plays the games headlessly (optionally in worker processes), keeps Elo
+ratings up to date after every game and stops a matchup early once every
+pairing inside it is statistically settled.
+"""
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from statistics import NormalDist
+
+from clock import GameClock
+from grid import Grid
+from game_logic import GameLogic
+
+ROUND_ROBIN = "round_robin"
+GAUNTLET = "gauntlet"
+
+
+class Entrant:
+    def __init__(self, name, player_class, **options):
+        """
+        Describe a tournament participant.
+        :param name: Unique display name, also used as the rating key.
+        :param player_class: AIPlayer (sub)class instantiated for every game.
+        :param options: Extra keyword arguments passed to the player class.
+        """
+        self.name = name
+        self.player_class = player_class
+        self.options = options
+
+    def create(self):
+        """
+        Build a fresh player instance for one game.
+        :return: A new player with a zero score.
+        """
+        return self.player_class(self.name, **self.options)
+
+
+def make_grid(board):
+    """
+    Build an empty grid from a board spec.
+    :param board: Grid size, (width, height) for a rectangular board, or
+                  (width, height, holes) with holes as a list of removed box corners.
+    :return: Grid instance.
+    """
+    if isinstance(board, tuple):
+        return Grid(*board)
+    return Grid(board)
+
+
+def play_game(board, entrants, seed=None, time_control=None):
+    """
+    Play one headless game between AI entrants, seated in the given order.
+    :param board: Board spec, as in make_grid().
+    :param entrants: Sequence of Entrant instances, one per seat.
+    :param seed: Optional seed for the random module during this game; the caller's
+                 global random state is restored afterwards.
+    :param time_control: Optional (initial_seconds, increment) giving every seat a GameClock budget.
+                         A seat that runs out of time loses the game on the spot.
+    :return: Dict with 'scores' (list, one per seat), 'moves' (list of (seat, start, end))
+             and 'flagged' (seat that ran out of time, or None).
+    """
+    # Players draw from the global random module, so seed it for this game only
+    saved_state = random.getstate() if seed is not None else None
+    if seed is not None:
+        random.seed(seed)
+    try:
+        return _play_seeded_game(board, entrants, time_control)
+    finally:
+        if saved_state is not None:
+            random.setstate(saved_state)
+
+
+def _play_seeded_game(board, entrants, time_control):
+    """Game loop for play_game, run with the random module already seeded."""
+    players = [entrant.create() for entrant in entrants]
+    grid = make_grid(board)
+    clock = None
+    if time_control is not None:
+        initial, increment = time_control
+        clock = GameClock(len(players), initial, increment)
+    game_logic = GameLogic(grid, players, clock)
+    moves = []
+    flagged = None
+    while not game_logic.is_game_over():
+        seat = game_logic.current_player_index
+        current = game_logic.get_current_player()
+        game_logic.start_clock()
+        move = current.choose_move(game_logic)
+        game_logic.stop_clock()
+        if clock is not None and clock.is_flagged(seat):
+            flagged = seat
+            break
+        if move is None:
+            break
+        start, end = move
+        if not grid.add_line(start, end):
+            raise RuntimeError(f"{current.name} played an invalid move: {move}")
+        moves.append((seat, start, end))
+        squares_completed = game_logic.check_for_squares(start, end)
+        if squares_completed > 0:
+            current.add_score(squares_completed)
+        else:
+            game_logic.switch_player()
+    return {"scores": [player.score for player in players], "moves": moves, "flagged": flagged}
+
+
+def _play_job(job):
+    """Unpack a (board, entrants, seed, time_control) job for executor.map."""
+    return play_game(*job)
+
+
+def pairwise_score(score_a, score_b):
+    """
+    Convert two final scores into a head-to-head result.
+    :return: 1.0 if a beat b, 0.0 if b beat a, 0.5 on a tie.
+    """
+    if score_a > score_b:
+        return 1.0
+    if score_a < score_b:
+        return 0.0
+    return 0.5
+
+
+class EloTable:
+    def __init__(self, k_factor=16, initial=1500.0):
+        """
+        Incrementally updated Elo ratings.
+        :param k_factor: Maximum rating change per head-to-head result.
+        :param initial: Rating assigned to unseen names.
+        """
+        self.k_factor = k_factor
+        self.initial = initial
+        self.ratings = {}
+
+    def rating(self, name):
+        """
+        Get the current rating for a name.
+        """
+        return self.ratings.get(name, self.initial)
+
+    def expected(self, name_a, name_b):
+        """
+        Expected score of a against b under the logistic Elo model.
+        """
+        return 1.0 / (1.0 + 10 ** ((self.rating(name_b) - self.rating(name_a)) / 400.0))
+
+    def update(self, name_a, name_b, score_a):
+        """
+        Apply one head-to-head result.
+        :param score_a: Result for a (1.0 win, 0.5 draw, 0.0 loss).
+        """
+        delta = self.k_factor * (score_a - self.expected(name_a, name_b))
+        self.ratings[name_a] = self.rating(name_a) + delta
+        self.ratings[name_b] = self.rating(name_b) - delta
+
+    def standings(self):
+        """
+        Get (name, rating) pairs sorted from strongest to weakest.
+        """
+        return sorted(self.ratings.items(), key=lambda item: item[1], reverse=True)
+
+
+class PairRecord:
+    def __init__(self):
+        """
+        Running head-to-head results for an ordered pair (a, b), from a's point of view.
+        """
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+
+    @property
+    def games(self):
+        return self.wins + self.draws + self.losses
+
+    def add(self, score):
+        """
+        Record one result for a (1.0, 0.5 or 0.0).
+        """
+        if score > 0.5:
+            self.wins += 1
+        elif score < 0.5:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    def mean(self):
+        """
+        Mean score for a, or 0.5 before any game.
+        """
+        if self.games == 0:
+            return 0.5
+        return (self.wins + 0.5 * self.draws) / self.games
+
+    def interval(self, z):
+        """
+        Wilson score interval for a's mean score (draws count as half a win).
+        Unlike the plain normal approximation it never collapses to zero width
+        when every result so far is a win or every result is a loss.
+        :param z: Two-sided critical value (e.g. 1.96 for 95%).
+        :return: Tuple (low, high).
+        """
+        n = self.games
+        if n == 0:
+            return 0.0, 1.0
+        p = self.mean()
+        z2 = z * z
+        denominator = 1 + z2 / n
+        center = (p + z2 / (2 * n)) / denominator
+        half_width = z * math.sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / denominator
+        return max(center - half_width, 0.0), min(center + half_width, 1.0)
+
+    def is_settled(self, z, min_games):
+        """
+        Check if the interval excludes an even match after at least min_games.
+        :param z: Critical value for this look (see Tournament, which corrects for repeated looks).
+        """
+        if self.games < min_games:
+            return False
+        low, high = self.interval(z)
+        return low > 0.5 or high < 0.5
+
+
+class Tournament:
+    def __init__(self, entrants, board_sizes=(3,), seats=2, mode=ROUND_ROBIN,
+                 min_games=10, max_games=200, batch_size=8, confidence=0.95,
+                 workers=1, k_factor=16, seed=0, time_control=None):
+        """
+        Configure a tournament.
+        :param entrants: List of Entrant instances; in gauntlet mode the first one is the candidate.
+        :param board_sizes: Boards to play every matchup on, as board specs for make_grid().
+        :param seats: Players per game (2-4).
+        :param mode: ROUND_ROBIN or GAUNTLET.
+        :param min_games: Games a matchup must play before it may stop early.
+        :param max_games: Hard cap on games per matchup.
+        :param batch_size: Games scheduled per matchup between stopping checks.
+        :param confidence: Overall two-sided confidence level for early stopping. The error
+                           rate is split evenly (Bonferroni alpha spending) across every
+                           stopping check a matchup can make, so repeated looks do not
+                           inflate false stops.
+        :param workers: Worker processes; 1 plays every game in-process.
+        :param k_factor: Elo K-factor.
+        :param seed: Seed for per-game seeds, so runs are reproducible.
+        :param time_control: Optional (initial_seconds, increment) clock for every game; running
+                             out of time loses the game.
+        """
+        if not 2 <= seats <= 4:
+            raise ValueError("seats must be between 2 and 4")
+        if len(entrants) < seats:
+            raise ValueError("need at least as many entrants as seats")
+        if len({entrant.name for entrant in entrants}) != len(entrants):
+            raise ValueError("entrant names must be unique")
+        if mode not in (ROUND_ROBIN, GAUNTLET):
+            raise ValueError(f"unknown tournament mode: {mode}")
+        self.entrants = list(entrants)
+        self.board_sizes = list(board_sizes)
+        self.seats = seats
+        self.mode = mode
+        self.min_games = min_games
+        self.max_games = max_games
+        self.batch_size = batch_size
+        # One look per batch: spend alpha / looks on each check
+        looks = max(1, math.ceil(max_games / batch_size))
+        self.z = NormalDist().inv_cdf(1 - (1 - confidence) / (2 * looks))
+        self.workers = workers
+        self.elo = EloTable(k_factor)
+        self.rng = random.Random(seed)
+        self.time_control = time_control
+        # Matchup keys are (board shape key, names), so board specs with holes stay hashable
+        self.records = {}       # (shape, names) -> {(name_a, name_b): PairRecord}
+        self.games_played = {}  # (shape, names) -> games played
+
+    def matchups(self):
+        """
+        List the scheduled matchups.
+        :return: List of (board spec, tuple of Entrant).
+        """
+        if self.mode == GAUNTLET:
+            candidate, opponents = self.entrants[0], self.entrants[1:]
+            groups = [(candidate,) + group for group in combinations(opponents, self.seats - 1)]
+        else:
+            groups = list(combinations(self.entrants, self.seats))
+        return [(size, group) for size in self.board_sizes for group in groups]
+
+    def is_settled(self, key):
+        """
+        Check if every pairing inside a matchup is statistically settled.
+        In gauntlet mode only the candidate's pairings count; opponents of equal
+        strength would otherwise never settle against each other.
+        """
+        records = self.records.get(key, {})
+        if self.mode == GAUNTLET:
+            candidate = self.entrants[0].name
+            records = {pair: record for pair, record in records.items() if candidate in pair}
+        return bool(records) and all(record.is_settled(self.z, self.min_games)
+                                     for record in records.values())
+
+    def _is_active(self, key):
+        return self.games_played.get(key, 0) < self.max_games and not self.is_settled(key)
+
+    def _schedule(self, size, group, key):
+        """Build the next batch of jobs for one matchup, rotating seats each game."""
+        jobs = []
+        start = self.games_played.get(key, 0)
+        for game_number in range(start, min(start + self.batch_size, self.max_games)):
+            shift = game_number % len(group)
+            seated = group[shift:] + group[:shift]
+            jobs.append((key, (size, seated, self.rng.getrandbits(32), self.time_control)))
+        return jobs
+
+    def record_game(self, key, seated, scores, flagged=None):
+        """
+        Fold one finished game into Elo ratings and the matchup's pair records.
+        :param key: Matchup key (board shape key such as "4x4", names).
+        :param seated: Entrants in seat order for this game.
+        :param scores: Final scores in seat order.
+        :param flagged: Seat that ran out of time; it loses to every other seat.
+        """
+        records = self.records.setdefault(key, {})
+        names = [entrant.name for entrant in seated]
+        for i, j in combinations(range(len(names)), 2):
+            name_a, name_b = sorted((names[i], names[j]))
+            seat_a, seat_b = names.index(name_a), names.index(name_b)
+            if flagged == seat_a:
+                score_a = 0.0
+            elif flagged == seat_b:
+                score_a = 1.0
+            else:
+                score_a = pairwise_score(scores[seat_a], scores[seat_b])
+            self.elo.update(name_a, name_b, score_a)
+            records.setdefault((name_a, name_b), PairRecord()).add(score_a)
+        self.games_played[key] = self.games_played.get(key, 0) + 1
+
+    def run(self):
+        """
+        Play batches until every matchup is settled or hits max_games.
+        :return: The EloTable with final ratings.
+        """
+        keyed = [((make_grid(size).topology.key, tuple(e.name for e in group)), size, group)
+                 for size, group in self.matchups()]
+        executor = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+        try:
+            while True:
+                jobs = []
+                for key, size, group in keyed:
+                    if self._is_active(key):
+                        jobs.extend(self._schedule(size, group, key))
+                if not jobs:
+                    break
+                payloads = [payload for _, payload in jobs]
+                if executor is None:
+                    results = map(_play_job, payloads)
+                else:
+                    results = executor.map(_play_job, payloads)
+                for (key, (_, seated, _, _)), result in zip(jobs, results):
+                    self.record_game(key, seated, result["scores"], result["flagged"])
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return self.elo